@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class SubmissionChat:
     participant_count: int
     chat_count: int
@@ -11,24 +11,24 @@ class SubmissionChat:
     chat_start_on: datetime
     chat_ended_on: datetime
 
-@dataclass
+@dataclass(slots=True)
 class ChatHistory:
     source_chat_id : str
     chat_list: List[SubmissionChat] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class SubmitDataResult:
     is_valid: bool
     error_text: str
 
-@dataclass
+@dataclass(slots=True)
 class SubmissionHistory:
     is_valid: bool
     error_text: str
     last_submission: datetime 
     chat_histories: List[ChatHistory] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class SubmitDataResponse:
     is_valid: bool
     error_text: str
\ No newline at end of file
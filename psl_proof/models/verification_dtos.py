@@ -2,7 +2,7 @@ from typing import List, Dict, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 
-@dataclass
+@dataclass(slots=True)
 class VerifyTokenResult:
     is_valid: bool
     error_text: str
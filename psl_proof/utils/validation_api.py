@@ -1,4 +1,13 @@
 from typing import Optional, List, Dict, Any
+import requests
+from requests.adapters import HTTPAdapter
+
+# Shared session so every validation API call reuses keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update({"Content-Type": "application/json"})
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+REQUEST_TIMEOUT = 30.0  # seconds
 
 def get_validation_api_url(
     config: Dict[str, Any],
@@ -10,3 +19,6 @@ def get_validation_api_url(
     url = f"{base_url}/{api_path}"
     print(f"API call: {url}")
     return url
+
+def get_validation_api_session() -> requests.Session:
+    return _SESSION
@@ -5,17 +5,16 @@ import traceback
 import sys
 from dataclasses import dataclass
 from psl_proof.models.cargo_data import SourceData
-from psl_proof.utils.validation_api import get_validation_api_url
+from psl_proof.utils.validation_api import get_validation_api_url, get_validation_api_session, REQUEST_TIMEOUT
 from psl_proof.models.verification_dtos import VerifyTokenResult
 
 
 def verify_token(config: Dict[str, Any], source_data: SourceData) -> Optional[VerifyTokenResult]:
     try:
         url = get_validation_api_url(config, "api/verifications/verify-token")
-        headers = {"Content-Type": "application/json"}
         payload = source_data.to_verification_json()
 
-        response = requests.post(url, json=payload, headers=headers)
+        response = get_validation_api_session().post(url, json=payload, timeout=REQUEST_TIMEOUT)
 
         if response.status_code == 200:
             try: